@@ -3,19 +3,29 @@ OmniFolio Storage Analysis PDF Generator
 Generates a professional PDF report of all database storage estimates.
 """
 
+from reportlab import rl_config
 from reportlab.lib.pagesizes import A4
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.styles import ParagraphStyle
 from reportlab.lib.units import cm
 from reportlab.lib import colors
 from reportlab.platypus import (
     SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle,
     HRFlowable, KeepTogether, PageBreak
 )
-from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
+from reportlab.lib.enums import TA_CENTER, TA_LEFT
+from reportlab.pdfbase.pdfmetrics import stringWidth
 from reportlab.platypus import Flowable
 from datetime import datetime
+from functools import lru_cache
+from itertools import chain
+import copy
+import io
 import os
 
+# Write deflated page streams as binary rather than through ReportLab's
+# pure-Python ASCII85 wrapper; smaller file, less time in doc.build()
+rl_config.useA85 = 0
+
 # ─── Colour palette ──────────────────────────────────────────────────────────
 BRAND_DARK   = colors.HexColor("#0F1117")   # near-black background feel
 BRAND_ACCENT = colors.HexColor("#6366F1")   # indigo – primary accent
@@ -26,17 +36,21 @@ BRAND_RED    = colors.HexColor("#EF4444")
 BRAND_GRAY   = colors.HexColor("#6B7280")
 TABLE_HEADER = colors.HexColor("#312E81")   # deep indigo for table headers
 ROW_ALT      = colors.HexColor("#F5F3FF")   # very light purple alternating row
+_GRID_COLOR  = colors.HexColor("#C7D2FE")   # table grid lines
+_TEXT_COLOR  = colors.HexColor("#1F2937")   # body / table cell text
 
 PAGE_W, PAGE_H = A4
 MARGIN = 1.8 * cm
 
 
 # ─── Styles ──────────────────────────────────────────────────────────────────
-styles = getSampleStyleSheet()
+# ParagraphStyle's defaults are exactly the sample sheet's "Normal", so the
+# styles below inherit from a bare one instead of building the whole sheet
+_NORMAL_STYLE = ParagraphStyle("Normal")
 
 title_style = ParagraphStyle(
     "Title",
-    parent=styles["Normal"],
+    parent=_NORMAL_STYLE,
     fontName="Helvetica-Bold",
     fontSize=26,
     textColor=BRAND_ACCENT,
@@ -46,7 +60,7 @@ title_style = ParagraphStyle(
 )
 subtitle_style = ParagraphStyle(
     "Subtitle",
-    parent=styles["Normal"],
+    parent=_NORMAL_STYLE,
     fontName="Helvetica",
     fontSize=11,
     textColor=BRAND_GRAY,
@@ -55,26 +69,28 @@ subtitle_style = ParagraphStyle(
 )
 section_style = ParagraphStyle(
     "Section",
-    parent=styles["Normal"],
+    parent=_NORMAL_STYLE,
     fontName="Helvetica-Bold",
     fontSize=13,
     textColor=BRAND_ACCENT,
     spaceBefore=14,
     spaceAfter=6,
     leading=16,
+    # Never leave a heading stranded at the foot of a page
+    keepWithNext=1,
 )
 body_style = ParagraphStyle(
     "Body",
-    parent=styles["Normal"],
+    parent=_NORMAL_STYLE,
     fontName="Helvetica",
     fontSize=9,
-    textColor=colors.HexColor("#1F2937"),
+    textColor=_TEXT_COLOR,
     spaceAfter=4,
     leading=13,
 )
 note_style = ParagraphStyle(
     "Note",
-    parent=styles["Normal"],
+    parent=_NORMAL_STYLE,
     fontName="Helvetica-Oblique",
     fontSize=8,
     textColor=BRAND_GRAY,
@@ -83,7 +99,7 @@ note_style = ParagraphStyle(
 )
 caption_style = ParagraphStyle(
     "Caption",
-    parent=styles["Normal"],
+    parent=_NORMAL_STYLE,
     fontName="Helvetica-Bold",
     fontSize=9,
     textColor=colors.white,
@@ -92,101 +108,174 @@ caption_style = ParagraphStyle(
 )
 warn_style = ParagraphStyle(
     "Warn",
-    parent=styles["Normal"],
+    parent=_NORMAL_STYLE,
     fontName="Helvetica-Bold",
     fontSize=9,
     textColor=BRAND_RED,
     leading=11,
 )
 
+# Grand-summary cells and insight titles reuse these instead of building a
+# ParagraphStyle per cell / per insight.
+_SUMMARY_BOLD_STYLE = ParagraphStyle(
+    "BoldCell",
+    parent=body_style,
+    fontName="Helvetica-Bold",
+    textColor=BRAND_ACCENT,
+)
+_SUMMARY_NORM_STYLE = ParagraphStyle(
+    "NormCell",
+    parent=body_style,
+    fontName="Helvetica",
+    textColor=_TEXT_COLOR,
+)
+_INSIGHT_TITLE_STYLES = {
+    color: ParagraphStyle(
+        "IT", parent=body_style, fontName="Helvetica-Bold",
+        textColor=color, fontSize=9.5
+    )
+    for color in (BRAND_RED, BRAND_GREEN, BRAND_YELLOW, BRAND_ACCENT)
+}
+
+# Title | body layout shared by every insight row
+_INSIGHT_COL_WIDTHS = (4.8 * cm, PAGE_W - 2 * MARGIN - 4.8 * cm)
+_INSIGHT_TABLE_STYLE = TableStyle([
+    ("VALIGN", (0, 0), (-1, -1), "TOP"),
+    ("LEFTPADDING", (0, 0), (-1, -1), 0),
+    ("RIGHTPADDING", (0, 0), (-1, -1), 0),
+    ("BOTTOMPADDING", (0, 0), (-1, -1), 2),
+    ("TOPPADDING", (0, 0), (-1, -1), 2),
+])
+
+
+# ─── Helper: cached paragraphs ───────────────────────────────────────────────
+@lru_cache(maxsize=2048)
+def _parse(text, style):
+    return Paragraph(text, style)
+
+
+def _para(text, style):
+    """
+    Paragraph for (text, style), parsed once per distinct pair.
+    Tables wrap cells in place, so each call returns a shallow copy that
+    shares the parsed fragments but keeps its own layout state.
+    """
+    return copy.copy(_parse(text, style))
+
+
+@lru_cache(maxsize=32)
+def _header_cells(headers):
+    return tuple(_parse(h, caption_style) for h in headers)
+
+
+def _header_row(headers):
+    """Caption row for a table; tables sharing headers share the parse."""
+    return [copy.copy(p) for p in _header_cells(tuple(headers))]
+
+
+@lru_cache(maxsize=32)
+def _widths_pt(col_widths):
+    """Column widths in cm → points, once per distinct width tuple."""
+    return tuple(w * cm for w in col_widths)
+
 
 # ─── Helper: build a styled table ────────────────────────────────────────────
+_CELL_PADDING = 5   # left/right padding of every table cell
+
+
+@lru_cache(maxsize=1024)
+def _fits_one_line(text, col_width):
+    """
+    True if a body cell can be drawn as a plain string: no markup or
+    entities, and one line of body_style text fits inside the padding.
+    Table draws such cells itself, skipping Paragraph's wrap on every pass.
+    """
+    if "<" in text or "&" in text:
+        return False
+    width = stringWidth(text, body_style.fontName, body_style.fontSize)
+    return width <= col_width - 2 * _CELL_PADDING
+
+
+# Neither style depends on the row count, so every table shares one instance
+_TABLE_STYLE = TableStyle([
+    # Header
+    ("BACKGROUND",  (0, 0), (-1, 0), TABLE_HEADER),
+    ("TEXTCOLOR",   (0, 0), (-1, 0), colors.white),
+    ("FONTNAME",    (0, 0), (-1, 0), "Helvetica-Bold"),
+    ("FONTSIZE",    (0, 0), (-1, 0), 8.5),
+    ("BOTTOMPADDING", (0, 0), (-1, 0), 6),
+    ("TOPPADDING",    (0, 0), (-1, 0), 6),
+    # Grid
+    ("GRID",        (0, 0), (-1, -1), 0.4, _GRID_COLOR),
+    ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, ROW_ALT]),
+    ("VALIGN",      (0, 0), (-1, -1), "MIDDLE"),
+    ("TOPPADDING",  (0, 1), (-1, -1), 4),
+    ("BOTTOMPADDING", (0, 1), (-1, -1), 4),
+    ("LEFTPADDING", (0, 0), (-1, -1), _CELL_PADDING),
+    ("RIGHTPADDING",(0, 0), (-1, -1), _CELL_PADDING),
+    # Plain-string body cells, drawn to match body_style
+    ("FONTNAME",    (0, 1), (-1, -1), body_style.fontName),
+    ("FONTSIZE",    (0, 1), (-1, -1), body_style.fontSize),
+    ("LEADING",     (0, 1), (-1, -1), body_style.leading),
+    ("TEXTCOLOR",   (0, 1), (-1, -1), body_style.textColor),
+])
+
+_SUMMARY_TABLE_STYLE = TableStyle([
+    ("BACKGROUND",  (0, 0), (-1, 0), TABLE_HEADER),
+    ("TEXTCOLOR",   (0, 0), (-1, 0), colors.white),
+    ("GRID",        (0, 0), (-1, -1), 0.4, _GRID_COLOR),
+    ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, ROW_ALT]),
+    ("VALIGN",      (0, 0), (-1, -1), "MIDDLE"),
+    ("TOPPADDING",  (0, 0), (-1, -1), 5),
+    ("BOTTOMPADDING", (0, 0), (-1, -1), 5),
+    ("LEFTPADDING", (0, 0), (-1, -1), 5),
+    ("RIGHTPADDING",(0, 0), (-1, -1), 5),
+    # Highlight grand-total row
+    ("BACKGROUND",  (0, -1), (-1, -1), BRAND_LIGHT),
+    ("FONTNAME",    (0, -1), (-1, -1), "Helvetica-Bold"),
+    ("LINEABOVE",   (0, -1), (-1, -1), 1.2, BRAND_ACCENT),
+])
+
+
 def make_table(headers, rows, col_widths, warn_col=None):
     """
-    headers  : list of header strings
-    rows     : list of lists (strings)
-    col_widths: list of floats (cm units)
+    headers  : sequence of header strings
+    rows     : sequence of row tuples (strings)
+    col_widths: sequence of floats (cm units)
     warn_col : index of a column whose value triggers red text if it contains "⚠"
     """
-    header_row = [Paragraph(f"<b>{h}</b>", caption_style) for h in headers]
-    data = [header_row]
-    for i, row in enumerate(rows):
-        styled = []
-        for j, cell in enumerate(row):
-            txt = str(cell)
+    col_widths_pt = _widths_pt(tuple(col_widths))
+    fits = _fits_one_line
+    data = [_header_row(headers)]
+    for row in rows:
+        styled = [
+            txt if fits(txt, w) else _para(txt, body_style)
+            for txt, w in zip(map(str, row), col_widths_pt)
+        ]
+        if warn_col is not None:
+            txt = str(row[warn_col])
             if "⚠️" in txt:
-                p = Paragraph(txt, warn_style)
-            else:
-                p = Paragraph(txt, body_style)
-            styled.append(p)
+                styled[warn_col] = _para(txt, warn_style)
         data.append(styled)
 
-    col_widths_pt = [w * cm for w in col_widths]
-
-    style = TableStyle([
-        # Header
-        ("BACKGROUND",  (0, 0), (-1, 0), TABLE_HEADER),
-        ("TEXTCOLOR",   (0, 0), (-1, 0), colors.white),
-        ("FONTNAME",    (0, 0), (-1, 0), "Helvetica-Bold"),
-        ("FONTSIZE",    (0, 0), (-1, 0), 8.5),
-        ("BOTTOMPADDING", (0, 0), (-1, 0), 6),
-        ("TOPPADDING",    (0, 0), (-1, 0), 6),
-        # Alternating rows
-        *[("BACKGROUND", (0, r), (-1, r), ROW_ALT) for r in range(2, len(data), 2)],
-        # Grid
-        ("GRID",        (0, 0), (-1, -1), 0.4, colors.HexColor("#C7D2FE")),
-        ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, ROW_ALT]),
-        ("VALIGN",      (0, 0), (-1, -1), "MIDDLE"),
-        ("TOPPADDING",  (0, 1), (-1, -1), 4),
-        ("BOTTOMPADDING", (0, 1), (-1, -1), 4),
-        ("LEFTPADDING", (0, 0), (-1, -1), 5),
-        ("RIGHTPADDING",(0, 0), (-1, -1), 5),
-    ])
-
-    t = Table(data, colWidths=col_widths_pt, repeatRows=1)
-    t.setStyle(style)
-    return t
+    return Table(data, colWidths=col_widths_pt, repeatRows=1, style=_TABLE_STYLE)
 
 
 def make_summary_table(headers, rows, col_widths):
     """Grand-summary table with bold grand-total row."""
-    header_row = [Paragraph(f"<b>{h}</b>", caption_style) for h in headers]
-    data = [header_row]
+    data = [_header_row(headers)]
     for row in rows:
-        is_total = str(row[0]).startswith("**")
-        styled = []
-        for cell in row:
-            txt = str(cell).strip("*")
-            st = ParagraphStyle(
-                "BoldCell" if is_total else "NormCell",
-                parent=body_style,
-                fontName="Helvetica-Bold" if is_total else "Helvetica",
-                textColor=BRAND_ACCENT if is_total else colors.HexColor("#1F2937"),
-            )
-            styled.append(Paragraph(txt, st))
-        data.append(styled)
+        cells = [str(cell) for cell in row]
+        # Total rows mark every cell with a leading "**"
+        if cells[0].startswith("**"):
+            st = _SUMMARY_BOLD_STYLE
+            cells = [c[2:] if c.startswith("**") else c for c in cells]
+        else:
+            st = _SUMMARY_NORM_STYLE
+        data.append([_para(txt, st) for txt in cells])
 
-    col_widths_pt = [w * cm for w in col_widths]
-
-    style = TableStyle([
-        ("BACKGROUND",  (0, 0), (-1, 0), TABLE_HEADER),
-        ("TEXTCOLOR",   (0, 0), (-1, 0), colors.white),
-        ("GRID",        (0, 0), (-1, -1), 0.4, colors.HexColor("#C7D2FE")),
-        ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, ROW_ALT]),
-        ("VALIGN",      (0, 0), (-1, -1), "MIDDLE"),
-        ("TOPPADDING",  (0, 0), (-1, -1), 5),
-        ("BOTTOMPADDING", (0, 0), (-1, -1), 5),
-        ("LEFTPADDING", (0, 0), (-1, -1), 5),
-        ("RIGHTPADDING",(0, 0), (-1, -1), 5),
-        # Highlight grand-total row
-        ("BACKGROUND",  (0, -1), (-1, -1), BRAND_LIGHT),
-        ("FONTNAME",    (0, -1), (-1, -1), "Helvetica-Bold"),
-        ("LINEABOVE",   (0, -1), (-1, -1), 1.2, BRAND_ACCENT),
-    ])
-
-    t = Table(data, colWidths=col_widths_pt, repeatRows=1)
-    t.setStyle(style)
-    return t
+    col_widths_pt = _widths_pt(tuple(col_widths))
+    return Table(data, colWidths=col_widths_pt, repeatRows=1, style=_SUMMARY_TABLE_STYLE)
 
 
 # ─── Pill / badge flowable ────────────────────────────────────────────────────
@@ -211,42 +300,34 @@ class ColorBadge(Flowable):
         return self.width, self.height
 
 
-# ─── Build document ──────────────────────────────────────────────────────────
-def build_pdf(output_path: str):
-    doc = SimpleDocTemplate(
-        output_path,
-        pagesize=A4,
-        leftMargin=MARGIN,
-        rightMargin=MARGIN,
-        topMargin=MARGIN,
-        bottomMargin=MARGIN,
-        title="OmniFolio Storage Analysis",
-        author="OmniFolio",
-    )
+# ─── Report sections ─────────────────────────────────────────────────────────
+# Each section yields its flowables in order; build_pdf chains them.
 
-    story = []
 
-    # ── Cover / Title ─────────────────────────────────────────────────────────
-    story.append(Spacer(1, 1.4 * cm))
-    story.append(Paragraph("OmniFolio", title_style))
-    story.append(Paragraph("Database &amp; Storage Analysis Report", subtitle_style))
-    story.append(Paragraph(f"Generated: {datetime.now().strftime('%B %d, %Y')}", subtitle_style))
-    story.append(Spacer(1, 0.3 * cm))
-    story.append(HRFlowable(width="100%", thickness=1.5, color=BRAND_ACCENT, spaceAfter=10))
-    story.append(Paragraph(
+# ─── Cover / Title ───────────────────────────────────────────────────────────
+def _cover():
+    yield Spacer(1, 1.4 * cm)
+    yield Paragraph("OmniFolio", title_style)
+    yield Paragraph("Database &amp; Storage Analysis Report", subtitle_style)
+    yield Paragraph(f"Generated: {datetime.now().strftime('%B %d, %Y')}", subtitle_style)
+    yield Spacer(1, 0.3 * cm)
+    yield HRFlowable(width="100%", thickness=1.5, color=BRAND_ACCENT, spaceAfter=10)
+    yield Paragraph(
         "This report quantifies all database tables, caches, and file storage used by OmniFolio "
         "across its data domains: SEC EDGAR, insider sentiment, government spending, LDA lobbying, "
         "financial calendars, user portfolio data, community features, and more. "
         "Estimates are provided for development baseline, 1,000 users at 12 months, "
         "and 10,000 users at 12 months.",
         body_style,
-    ))
-    story.append(Spacer(1, 0.4 * cm))
+    )
+    yield Spacer(1, 0.4 * cm)
 
-    # ─────────────────────────────────────────────────────────────────────────
-    # SECTION 1 – SEC EDGAR
-    # ─────────────────────────────────────────────────────────────────────────
-    story.append(KeepTogether([
+
+# ─────────────────────────────────────────────────────────────────────────────
+# SECTION 1 – SEC EDGAR
+# ─────────────────────────────────────────────────────────────────────────────
+def _section_sec_edgar():
+    yield from (
         Paragraph("1. SEC EDGAR Data", section_style),
         Paragraph(
             "Data sourced from SEC EDGAR (XBRL financials, Form 4 insider transactions, 13F institutional "
@@ -254,33 +335,35 @@ def build_pdf(output_path: str):
             "not with user count.",
             body_style,
         ),
-    ]))
-
-    sec_headers = ["Table", "Avg Row Size", "Monthly Growth", "Current Est.", "12-Month Projection"]
-    sec_rows = [
-        ["sec_companies",              "~300 B",  "One-time load (10K+ companies)",         "3–4 MB",   "4 MB (stable)"],
-        ["sec_filings",                "~500 B",  "~200/symbol × 15 symbols",               "15 MB",    "50–80 MB"],
-        ["sec_financials",             "~2 KB",   "~8 rows/quarter/symbol (70+ NUMERIC cols)","5 MB",   "20–40 MB"],
-        ["sec_insider_transactions",   "~400 B",  "~50/symbol/month",                       "3 MB",     "15–25 MB"],
-        ["sec_institutional_holdings", "~350 B",  "~500/fund × 3 funds/quarter",            "2 MB",     "10–15 MB"],
-        ["sec_filing_sections",        "5–50 KB", "Sporadic (full plain_text + keywords)",  "20 MB",    "100–300 MB ⚠️"],
-        ["sec_watchlist",              "~200 B",  "Per active user",                        "< 1 MB",   "< 5 MB"],
-        ["sec_filing_alerts",          "~300 B",  "Per filing event/user",                  "< 1 MB",   "~10 MB"],
-        ["sec_cache_refresh_log",      "~150 B",  "1 row/cache key",                        "< 0.1 MB", "< 0.1 MB"],
-    ]
-    story.append(make_table(sec_headers, sec_rows, [4.5, 2.2, 4.5, 2.2, 3.6]))
-    story.append(Paragraph(
+    )
+
+    sec_headers = ("Table", "Avg Row Size", "Monthly Growth", "Current Est.", "12-Month Projection")
+    sec_rows = (
+        ("sec_companies",              "~300 B",  "One-time load (10K+ companies)",         "3–4 MB",   "4 MB (stable)"),
+        ("sec_filings",                "~500 B",  "~200/symbol × 15 symbols",               "15 MB",    "50–80 MB"),
+        ("sec_financials",             "~2 KB",   "~8 rows/quarter/symbol (70+ NUMERIC cols)","5 MB",   "20–40 MB"),
+        ("sec_insider_transactions",   "~400 B",  "~50/symbol/month",                       "3 MB",     "15–25 MB"),
+        ("sec_institutional_holdings", "~350 B",  "~500/fund × 3 funds/quarter",            "2 MB",     "10–15 MB"),
+        ("sec_filing_sections",        "5–50 KB", "Sporadic (full plain_text + keywords)",  "20 MB",    "100–300 MB ⚠️"),
+        ("sec_watchlist",              "~200 B",  "Per active user",                        "< 1 MB",   "< 5 MB"),
+        ("sec_filing_alerts",          "~300 B",  "Per filing event/user",                  "< 1 MB",   "~10 MB"),
+        ("sec_cache_refresh_log",      "~150 B",  "1 row/cache key",                        "< 0.1 MB", "< 0.1 MB"),
+    )
+    yield make_table(sec_headers, sec_rows, (4.5, 2.2, 4.5, 2.2, 3.6), warn_col=4)
+    yield Paragraph(
         "⚠️  sec_filing_sections stores full extracted text (Risk Factors, MD&amp;A) — "
         "15 symbols × 20 filings × 5 sections can reach 750 MB if unconstrained. "
         "Recommend capping stored text at 10,000 characters per section.",
         note_style,
-    ))
-    story.append(Paragraph("<b>SEC subtotal:</b> ~48 MB now → ~200–460 MB at 12 months", body_style))
+    )
+    yield Paragraph("<b>SEC subtotal:</b> ~48 MB now → ~200–460 MB at 12 months", body_style)
+
 
-    # ─────────────────────────────────────────────────────────────────────────
-    # SECTION 2 – Proprietary Sentiment & Analysis Caches
-    # ─────────────────────────────────────────────────────────────────────────
-    story.append(KeepTogether([
+# ─────────────────────────────────────────────────────────────────────────────
+# SECTION 2 – Proprietary Sentiment & Analysis Caches
+# ─────────────────────────────────────────────────────────────────────────────
+def _section_sentiment():
+    yield from (
         Paragraph("2. Proprietary Sentiment &amp; Analysis Caches", section_style),
         Paragraph(
             "Computed from SEC Form 4 and 10-Q/10-K XBRL filings using OmniFolio's proprietary "
@@ -288,24 +371,26 @@ def build_pdf(output_path: str):
             "Smart TTL between 2h–72h keeps sizes bounded.",
             body_style,
         ),
-    ]))
-
-    sent_headers = ["Table", "Avg Row Size", "Growth Model", "12-Month Est."]
-    sent_rows = [
-        ["insider_sentiment_cache",        "~400 B",  "1 row/symbol/month × symbols tracked",    "2–5 MB"],
-        ["insider_sentiment_transactions", "~500 B",  "~50 txns/symbol/month × 15 symbols",      "5–10 MB"],
-        ["insider_sentiment_refresh_log",  "~200 B",  "Cleaned after 30 days (bounded)",         "< 1 MB"],
-        ["earnings_surprises_cache",       "~1.2 KB", "4 rows/symbol/year (50+ columns)",        "3–5 MB"],
-        ["earnings_estimates_history",     "~200 B",  "Snapshot per analyst revision",           "1–2 MB"],
-        ["earnings_surprises_refresh_log", "~200 B",  "Cleaned periodically",                    "< 1 MB"],
-    ]
-    story.append(make_table(sent_headers, sent_rows, [5.5, 2.2, 6.0, 3.3]))
-    story.append(Paragraph("<b>Sentiment subtotal:</b> ~12 MB now → ~12–24 MB at 12 months", body_style))
+    )
+
+    sent_headers = ("Table", "Avg Row Size", "Growth Model", "12-Month Est.")
+    sent_rows = (
+        ("insider_sentiment_cache",        "~400 B",  "1 row/symbol/month × symbols tracked",    "2–5 MB"),
+        ("insider_sentiment_transactions", "~500 B",  "~50 txns/symbol/month × 15 symbols",      "5–10 MB"),
+        ("insider_sentiment_refresh_log",  "~200 B",  "Cleaned after 30 days (bounded)",         "< 1 MB"),
+        ("earnings_surprises_cache",       "~1.2 KB", "4 rows/symbol/year (50+ columns)",        "3–5 MB"),
+        ("earnings_estimates_history",     "~200 B",  "Snapshot per analyst revision",           "1–2 MB"),
+        ("earnings_surprises_refresh_log", "~200 B",  "Cleaned periodically",                    "< 1 MB"),
+    )
+    yield make_table(sent_headers, sent_rows, (5.5, 2.2, 6.0, 3.3))
+    yield Paragraph("<b>Sentiment subtotal:</b> ~12 MB now → ~12–24 MB at 12 months", body_style)
+
 
-    # ─────────────────────────────────────────────────────────────────────────
-    # SECTION 3 – Government & Public Data (LDA, USAspending)
-    # ─────────────────────────────────────────────────────────────────────────
-    story.append(KeepTogether([
+# ─────────────────────────────────────────────────────────────────────────────
+# SECTION 3 – Government & Public Data (LDA, USAspending)
+# ─────────────────────────────────────────────────────────────────────────────
+def _section_government():
+    yield from (
         Paragraph("3. Government &amp; Public Data Caches (Senate LDA, USAspending.gov)", section_style),
         Paragraph(
             "100% public government data. Senate Lobbying Disclosure Act (LDA) filings via lda.senate.gov, "
@@ -313,23 +398,25 @@ def build_pdf(output_path: str):
             "Both caches use weekly TTL (168h) and 30-day log cleanup.",
             body_style,
         ),
-    ]))
-
-    gov_headers = ["Table", "Avg Row Size", "Growth Model", "12-Month Est."]
-    gov_rows = [
-        ["senate_lobbying_cache",      "~800 B", "~20 filings/symbol × 15 symbols (JSONB arrays)", "5–10 MB"],
-        ["senate_lobbying_refresh_log","~200 B", "Cleaned after 30 days",                          "< 1 MB"],
-        ["usa_spending_cache",         "~600 B", "~50 awards/symbol × 15 symbols",                 "5–10 MB"],
-        ["usa_spending_refresh_log",   "~200 B", "Cleaned after 30 days",                          "< 1 MB"],
-    ]
-    story.append(make_table(gov_headers, gov_rows, [5.5, 2.2, 6.0, 3.3]))
-    story.append(Paragraph("<b>Government data subtotal:</b> ~12 MB now → ~12–22 MB at 12 months", body_style))
-
-    # ─────────────────────────────────────────────────────────────────────────
-    # SECTION 4 – Calendar & News Caches
-    # ─────────────────────────────────────────────────────────────────────────
-    story.append(PageBreak())
-    story.append(KeepTogether([
+    )
+
+    gov_headers = ("Table", "Avg Row Size", "Growth Model", "12-Month Est.")
+    gov_rows = (
+        ("senate_lobbying_cache",      "~800 B", "~20 filings/symbol × 15 symbols (JSONB arrays)", "5–10 MB"),
+        ("senate_lobbying_refresh_log","~200 B", "Cleaned after 30 days",                          "< 1 MB"),
+        ("usa_spending_cache",         "~600 B", "~50 awards/symbol × 15 symbols",                 "5–10 MB"),
+        ("usa_spending_refresh_log",   "~200 B", "Cleaned after 30 days",                          "< 1 MB"),
+    )
+    yield make_table(gov_headers, gov_rows, (5.5, 2.2, 6.0, 3.3))
+    yield Paragraph("<b>Government data subtotal:</b> ~12 MB now → ~12–22 MB at 12 months", body_style)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# SECTION 4 – Calendar & News Caches
+# ─────────────────────────────────────────────────────────────────────────────
+def _section_calendar():
+    yield PageBreak()
+    yield from (
         Paragraph("4. Calendar &amp; News Caches", section_style),
         Paragraph(
             "IPO and earnings calendars sourced from SEC EDGAR (S-1/10-Q filings). "
@@ -337,27 +424,29 @@ def build_pdf(output_path: str):
             "Twitter/X feed cache rolls over every 15 days.",
             body_style,
         ),
-    ]))
-
-    cal_headers = ["Table", "Avg Row Size", "Growth Model", "12-Month Est."]
-    cal_rows = [
-        ["ipo_calendar_cache",         "~500 B + JSONB", "~200 IPOs/year",                        "2–5 MB"],
-        ["earnings_calendar_cache",    "~400 B + JSONB", "~5,000 earnings reports/quarter",       "10–20 MB"],
-        ["economic_calendar_cache",    "~300 B",         "~50 events/week × 52 weeks",            "1–2 MB"],
-        ["twitter_feed_cache",         "~1 KB",          "Rolling 15-day window",                 "5–10 MB"],
-        ["crypto_fear_and_greed",      "~100 B",         "1 row/day (daily update)",              "< 0.1 MB"],
-        ["ipo_calendar_meta",          "~100 B",         "Few config rows",                       "< 0.1 MB"],
-        ["earnings_calendar_meta",     "~100 B",         "Few config rows",                       "< 0.1 MB"],
-        ["economic_calendar_meta",     "~100 B",         "Few config rows",                       "< 0.1 MB"],
-        ["cache_metadata",             "~100 B",         "1 row per cache name (static)",         "< 0.1 MB"],
-    ]
-    story.append(make_table(cal_headers, cal_rows, [4.8, 2.6, 5.2, 2.6 + 1.8]))
-    story.append(Paragraph("<b>Calendar/News subtotal:</b> ~18 MB now → ~18–37 MB at 12 months", body_style))
+    )
 
-    # ─────────────────────────────────────────────────────────────────────────
-    # SECTION 5 – User Portfolio Data
-    # ─────────────────────────────────────────────────────────────────────────
-    story.append(KeepTogether([
+    cal_headers = ("Table", "Avg Row Size", "Growth Model", "12-Month Est.")
+    cal_rows = (
+        ("ipo_calendar_cache",         "~500 B + JSONB", "~200 IPOs/year",                        "2–5 MB"),
+        ("earnings_calendar_cache",    "~400 B + JSONB", "~5,000 earnings reports/quarter",       "10–20 MB"),
+        ("economic_calendar_cache",    "~300 B",         "~50 events/week × 52 weeks",            "1–2 MB"),
+        ("twitter_feed_cache",         "~1 KB",          "Rolling 15-day window",                 "5–10 MB"),
+        ("crypto_fear_and_greed",      "~100 B",         "1 row/day (daily update)",              "< 0.1 MB"),
+        ("ipo_calendar_meta",          "~100 B",         "Few config rows",                       "< 0.1 MB"),
+        ("earnings_calendar_meta",     "~100 B",         "Few config rows",                       "< 0.1 MB"),
+        ("economic_calendar_meta",     "~100 B",         "Few config rows",                       "< 0.1 MB"),
+        ("cache_metadata",             "~100 B",         "1 row per cache name (static)",         "< 0.1 MB"),
+    )
+    yield make_table(cal_headers, cal_rows, (4.8, 2.6, 5.2, 2.6 + 1.8))
+    yield Paragraph("<b>Calendar/News subtotal:</b> ~18 MB now → ~18–37 MB at 12 months", body_style)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# SECTION 5 – User Portfolio Data
+# ─────────────────────────────────────────────────────────────────────────────
+def _section_user_data():
+    yield from (
         Paragraph("5. User Portfolio Data", section_style),
         Paragraph(
             "All user-owned financial data: holdings, transactions, snapshots. "
@@ -365,62 +454,66 @@ def build_pdf(output_path: str):
             "price_snapshots is bounded by a 48-hour auto-cleanup function.",
             body_style,
         ),
-    ]))
-
-    user_headers = ["Table", "Avg Row Size", "Growth per User", "Per 1K Users (12 mo)"]
-    user_rows = [
-        ["encrypted_state_snapshots", "2–50 KB",  "1 row/user (upserted, E2E encrypted)",  "2–50 MB"],
-        ["portfolio_snapshots",        "~500 B",   "1 snapshot/day × 365",                 "180 MB"],
-        ["price_snapshots",            "~100 B",   "Cleaned every 48 hours",               "5–10 MB (rolling)"],
-        ["users / profiles",           "~500 B",   "1 row/user",                           "0.5 MB"],
-        ["user_subscriptions",         "~300 B",   "1 row/user",                           "0.3 MB"],
-        ["user_usage",                 "~300 B",   "1 row/user/day × 365",                 "110 MB"],
-        ["cash_accounts",              "~200 B",   "Max 10–50 entries",                    "10 MB"],
-        ["savings_accounts",           "~200 B",   "Max 10–50 entries",                    "10 MB"],
-        ["crypto_holdings",            "~300 B",   "Max 10–50 entries",                    "15 MB"],
-        ["stock_holdings",             "~300 B",   "Max 10–50 entries",                    "15 MB"],
-        ["crypto_transactions",        "~300 B",   "Moderate",                             "30 MB"],
-        ["stock_transactions",         "~300 B",   "Moderate",                             "30 MB"],
-        ["trading_accounts",           "~200 B",   "Max 10–50 entries",                    "10 MB"],
-        ["real_estate",                "~400 B",   "Few per user",                         "5 MB"],
-        ["valuable_items",             "~300 B",   "Few per user",                         "5 MB"],
-        ["expense_categories",         "~200 B",   "10–20 per user",                       "4 MB"],
-        ["income_sources",             "~200 B",   "Few per user",                         "2 MB"],
-        ["tax_profiles",               "~300 B",   "1 per user",                           "0.3 MB"],
-        ["exchange_rates_history",     "~100 B",   "30 currencies × 365 days (shared)",    "5 MB"],
-        ["user_currency_preferences",  "~100 B",   "1 row/user",                           "0.1 MB"],
-    ]
-    story.append(make_table(user_headers, user_rows, [5.0, 2.4, 5.0, 4.6]))
-    story.append(Paragraph("<b>User data per 1,000 users:</b> ~430 MB → ~4.3 GB for 10,000 users", body_style))
+    )
+
+    user_headers = ("Table", "Avg Row Size", "Growth per User", "Per 1K Users (12 mo)")
+    user_rows = (
+        ("encrypted_state_snapshots", "2–50 KB",  "1 row/user (upserted, E2E encrypted)",  "2–50 MB"),
+        ("portfolio_snapshots",        "~500 B",   "1 snapshot/day × 365",                 "180 MB"),
+        ("price_snapshots",            "~100 B",   "Cleaned every 48 hours",               "5–10 MB (rolling)"),
+        ("users / profiles",           "~500 B",   "1 row/user",                           "0.5 MB"),
+        ("user_subscriptions",         "~300 B",   "1 row/user",                           "0.3 MB"),
+        ("user_usage",                 "~300 B",   "1 row/user/day × 365",                 "110 MB"),
+        ("cash_accounts",              "~200 B",   "Max 10–50 entries",                    "10 MB"),
+        ("savings_accounts",           "~200 B",   "Max 10–50 entries",                    "10 MB"),
+        ("crypto_holdings",            "~300 B",   "Max 10–50 entries",                    "15 MB"),
+        ("stock_holdings",             "~300 B",   "Max 10–50 entries",                    "15 MB"),
+        ("crypto_transactions",        "~300 B",   "Moderate",                             "30 MB"),
+        ("stock_transactions",         "~300 B",   "Moderate",                             "30 MB"),
+        ("trading_accounts",           "~200 B",   "Max 10–50 entries",                    "10 MB"),
+        ("real_estate",                "~400 B",   "Few per user",                         "5 MB"),
+        ("valuable_items",             "~300 B",   "Few per user",                         "5 MB"),
+        ("expense_categories",         "~200 B",   "10–20 per user",                       "4 MB"),
+        ("income_sources",             "~200 B",   "Few per user",                         "2 MB"),
+        ("tax_profiles",               "~300 B",   "1 per user",                           "0.3 MB"),
+        ("exchange_rates_history",     "~100 B",   "30 currencies × 365 days (shared)",    "5 MB"),
+        ("user_currency_preferences",  "~100 B",   "1 row/user",                           "0.1 MB"),
+    )
+    yield make_table(user_headers, user_rows, (5.0, 2.4, 5.0, 4.6))
+    yield Paragraph("<b>User data per 1,000 users:</b> ~430 MB → ~4.3 GB for 10,000 users", body_style)
 
-    # ─────────────────────────────────────────────────────────────────────────
-    # SECTION 6 – Community
-    # ─────────────────────────────────────────────────────────────────────────
-    story.append(KeepTogether([
+
+# ─────────────────────────────────────────────────────────────────────────────
+# SECTION 6 – Community
+# ─────────────────────────────────────────────────────────────────────────────
+def _section_community():
+    yield from (
         Paragraph("6. Community Data", section_style),
         Paragraph(
             "Social features: posts, comments, likes, follows, hashtags. "
             "Comments can grow 5× faster than posts if engagement is high.",
             body_style,
         ),
-    ]))
-
-    comm_headers = ["Table", "Avg Row Size", "Growth Model", "Per 1K Users (12 mo)"]
-    comm_rows = [
-        ["posts",          "~500 B",  "~10 posts/user/month × 12 months",  "60 MB"],
-        ["comments",       "~300 B",  "~5 comments/post",                  "180 MB"],
-        ["post_likes",     "~50 B",   "Variable engagement",               "10 MB"],
-        ["follows",        "~50 B",   "Variable",                          "5 MB"],
-        ["hashtags",       "~100 B",  "Unique hashtag registry",           "1 MB"],
-        ["post_hashtags",  "~60 B",   "~3 tags/post",                      "4 MB"],
-    ]
-    story.append(make_table(comm_headers, comm_rows, [3.8, 2.4, 5.2, 5.6]))
-    story.append(Paragraph("<b>Community subtotal per 1,000 users:</b> ~260 MB → ~2.6 GB for 10,000 users", body_style))
+    )
 
-    # ─────────────────────────────────────────────────────────────────────────
-    # SECTION 7 – File Storage (Supabase Storage Buckets)
-    # ─────────────────────────────────────────────────────────────────────────
-    story.append(KeepTogether([
+    comm_headers = ("Table", "Avg Row Size", "Growth Model", "Per 1K Users (12 mo)")
+    comm_rows = (
+        ("posts",          "~500 B",  "~10 posts/user/month × 12 months",  "60 MB"),
+        ("comments",       "~300 B",  "~5 comments/post",                  "180 MB"),
+        ("post_likes",     "~50 B",   "Variable engagement",               "10 MB"),
+        ("follows",        "~50 B",   "Variable",                          "5 MB"),
+        ("hashtags",       "~100 B",  "Unique hashtag registry",           "1 MB"),
+        ("post_hashtags",  "~60 B",   "~3 tags/post",                      "4 MB"),
+    )
+    yield make_table(comm_headers, comm_rows, (3.8, 2.4, 5.2, 5.6))
+    yield Paragraph("<b>Community subtotal per 1,000 users:</b> ~260 MB → ~2.6 GB for 10,000 users", body_style)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# SECTION 7 – File Storage (Supabase Storage Buckets)
+# ─────────────────────────────────────────────────────────────────────────────
+def _section_file_storage():
+    yield from (
         Paragraph("7. File Storage (Supabase Storage Buckets)", section_style),
         Paragraph(
             "Object storage for binary files. post-images is the dominant growth driver and "
@@ -428,51 +521,55 @@ def build_pdf(output_path: str):
             "compressed to 800px width server-side).",
             body_style,
         ),
-    ]))
+    )
 
-    file_headers = ["Bucket", "Avg File Size", "Growth", "Per 1K Users (12 mo)"]
-    file_rows = [
-        ["avatars",      "100–500 KB", "1 avatar/user",                     "100–500 MB"],
-        ["post-images",  "200 KB–2 MB","~5 images/user/month × 12 months",  "1–10 GB ⚠️"],
-    ]
-    story.append(make_table(file_headers, file_rows, [4.0, 3.0, 5.5, 4.5]))
-    story.append(Paragraph(
+    file_headers = ("Bucket", "Avg File Size", "Growth", "Per 1K Users (12 mo)")
+    file_rows = (
+        ("avatars",      "100–500 KB", "1 avatar/user",                     "100–500 MB"),
+        ("post-images",  "200 KB–2 MB","~5 images/user/month × 12 months",  "1–10 GB ⚠️"),
+    )
+    yield make_table(file_headers, file_rows, (4.0, 3.0, 5.5, 4.5), warn_col=3)
+    yield Paragraph(
         "⚠️  post-images is the largest wildcard. Without compression, 10K active users "
         "posting images could generate 10–100 GB of file storage.",
         note_style,
-    ))
-
-    # ─────────────────────────────────────────────────────────────────────────
-    # SECTION 8 – Grand Summary
-    # ─────────────────────────────────────────────────────────────────────────
-    story.append(PageBreak())
-    story.append(Paragraph("8. Grand Summary", section_style))
-    story.append(Paragraph(
+    )
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# SECTION 8 – Grand Summary
+# ─────────────────────────────────────────────────────────────────────────────
+def _section_summary():
+    yield PageBreak()
+    yield Paragraph("8. Grand Summary", section_style)
+    yield Paragraph(
         "Database totals include ~20% overhead for indexes. "
         "File storage totals are separate from database storage.",
         body_style,
-    ))
-
-    sum_headers = ["Category", "Dev / Baseline", "1K Users @ 12 Mo", "10K Users @ 12 Mo"]
-    sum_rows = [
-        ["SEC EDGAR (DB)",              "~48 MB",    "200–460 MB",     "200–460 MB (shared)"],
-        ["Sentiment & Analysis (DB)",   "~12 MB",    "12–24 MB",       "12–24 MB (shared)"],
-        ["Gov Data / LDA (DB)",         "~12 MB",    "12–22 MB",       "12–22 MB (shared)"],
-        ["Calendar & News (DB)",        "~18 MB",    "18–37 MB",       "18–37 MB (shared)"],
-        ["User Portfolio Data (DB)",    "< 1 MB",    "~430 MB",        "~4.3 GB"],
-        ["Community (DB)",              "< 1 MB",    "~260 MB",        "~2.6 GB"],
-        ["Reference & Config (DB)",     "~10 MB",    "~25 MB",         "~200 MB"],
-        ["Index overhead (~20%)",       "~20 MB",    "~190 MB",        "~1.5 GB"],
-        ["**DB Total",                  "**~121 MB", "**~1.2–1.5 GB", "**~8–10 GB"],
-        ["File Storage (Buckets)",      "~10 MB",    "1–10 GB",        "10–100 GB ⚠️"],
-        ["**Grand Total",               "**~131 MB", "**~2–12 GB",    "**~18–110 GB"],
-    ]
-    story.append(make_summary_table(sum_headers, sum_rows, [5.5, 3.0, 4.0, 4.5]))
+    )
+
+    sum_headers = ("Category", "Dev / Baseline", "1K Users @ 12 Mo", "10K Users @ 12 Mo")
+    sum_rows = (
+        ("SEC EDGAR (DB)",              "~48 MB",    "200–460 MB",     "200–460 MB (shared)"),
+        ("Sentiment & Analysis (DB)",   "~12 MB",    "12–24 MB",       "12–24 MB (shared)"),
+        ("Gov Data / LDA (DB)",         "~12 MB",    "12–22 MB",       "12–22 MB (shared)"),
+        ("Calendar & News (DB)",        "~18 MB",    "18–37 MB",       "18–37 MB (shared)"),
+        ("User Portfolio Data (DB)",    "< 1 MB",    "~430 MB",        "~4.3 GB"),
+        ("Community (DB)",              "< 1 MB",    "~260 MB",        "~2.6 GB"),
+        ("Reference & Config (DB)",     "~10 MB",    "~25 MB",         "~200 MB"),
+        ("Index overhead (~20%)",       "~20 MB",    "~190 MB",        "~1.5 GB"),
+        ("**DB Total",                  "**~121 MB", "**~1.2–1.5 GB", "**~8–10 GB"),
+        ("File Storage (Buckets)",      "~10 MB",    "1–10 GB",        "10–100 GB ⚠️"),
+        ("**Grand Total",               "**~131 MB", "**~2–12 GB",    "**~18–110 GB"),
+    )
+    yield make_summary_table(sum_headers, sum_rows, (5.5, 3.0, 4.0, 4.5))
+
 
-    # ─────────────────────────────────────────────────────────────────────────
-    # SECTION 9 – Key Insights & Recommendations
-    # ─────────────────────────────────────────────────────────────────────────
-    story.append(Paragraph("9. Key Insights &amp; Recommendations", section_style))
+# ─────────────────────────────────────────────────────────────────────────────
+# SECTION 9 – Key Insights & Recommendations
+# ─────────────────────────────────────────────────────────────────────────────
+def _section_insights():
+    yield Paragraph("9. Key Insights &amp; Recommendations", section_style)
 
     insights = [
         (BRAND_RED,    "⚠️  sec_filing_sections",
@@ -502,41 +599,82 @@ def build_pdf(output_path: str):
     ]
 
     for color, title, body in insights:
-        story.append(KeepTogether([
+        yield KeepTogether([
             Spacer(1, 0.2 * cm),
             Table(
-                [[Paragraph(f"<b>{title}</b>", ParagraphStyle(
-                    "IT", parent=body_style, fontName="Helvetica-Bold",
-                    textColor=color, fontSize=9.5
-                )),
+                [[Paragraph(f"<b>{title}</b>", _INSIGHT_TITLE_STYLES[color]),
                 Paragraph(body, body_style)]],
-                colWidths=[4.8 * cm, (PAGE_W - 2 * MARGIN - 4.8 * cm)],
-                style=TableStyle([
-                    ("VALIGN", (0, 0), (-1, -1), "TOP"),
-                    ("LEFTPADDING", (0, 0), (-1, -1), 0),
-                    ("RIGHTPADDING", (0, 0), (-1, -1), 0),
-                    ("BOTTOMPADDING", (0, 0), (-1, -1), 2),
-                    ("TOPPADDING", (0, 0), (-1, -1), 2),
-                ]),
+                colWidths=_INSIGHT_COL_WIDTHS,
+                style=_INSIGHT_TABLE_STYLE,
             ),
-        ]))
+        ])
 
-    # ─── Footer note ─────────────────────────────────────────────────────────
-    story.append(Spacer(1, 0.6 * cm))
-    story.append(HRFlowable(width="100%", thickness=0.8, color=BRAND_GRAY, spaceAfter=6))
-    story.append(Paragraph(
+
+# ─── Footer note ─────────────────────────────────────────────────────────────
+def _footer():
+    yield Spacer(1, 0.6 * cm)
+    yield HRFlowable(width="100%", thickness=0.8, color=BRAND_GRAY, spaceAfter=6)
+    yield Paragraph(
         "All figures are estimates based on schema analysis and typical usage patterns. "
         "Actual sizes depend on content length (especially JSONB fields and free-text columns), "
         "user activity level, and cleanup job execution frequency. "
         "Re-run this analysis after each major schema change.",
         note_style,
-    ))
-    story.append(Paragraph(
+    )
+    yield Paragraph(
         f"© {datetime.now().year} OmniFolio  •  Confidential &amp; Proprietary",
         ParagraphStyle("Footer", parent=note_style, alignment=TA_CENTER, textColor=BRAND_GRAY),
-    ))
+    )
+
+
+_SECTIONS = (
+    _cover,
+    _section_sec_edgar,
+    _section_sentiment,
+    _section_government,
+    _section_calendar,
+    _section_user_data,
+    _section_community,
+    _section_file_storage,
+    _section_summary,
+    _section_insights,
+    _footer,
+)
+
+
+# ─── Build document ──────────────────────────────────────────────────────────
+def _build_story(workers: int = 1):
+    """
+    Collect every section's flowables in document order.
+    Sections are independent, so with workers > 1 they are built on a
+    thread pool and concatenated in order afterwards.
+    """
+    if workers <= 1:
+        return list(chain.from_iterable(section() for section in _SECTIONS))
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        parts = list(ex.map(lambda section: list(section()), _SECTIONS))
+    return list(chain.from_iterable(parts))
+
+
+def build_pdf(output_path: str, workers: int = 1):
+    buf = io.BytesIO()
+    doc = SimpleDocTemplate(
+        buf,
+        pagesize=A4,
+        leftMargin=MARGIN,
+        rightMargin=MARGIN,
+        topMargin=MARGIN,
+        bottomMargin=MARGIN,
+        title="OmniFolio Storage Analysis",
+        author="OmniFolio",
+    )
 
+    story = _build_story(workers)
     doc.build(story)
+    # One write of the finished document; a failed build leaves no partial file
+    with open(output_path, "wb") as f:
+        f.write(buf.getbuffer())
     print(f"✅  PDF generated: {output_path}")
 
 